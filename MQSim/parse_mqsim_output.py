@@ -155,18 +155,20 @@ def compare_all(labels: list, results: list):
             return -1
         return (min if lower_better else max)(valid, key=lambda x: x[1])[0]
 
+    str_spec = f">{col_w}"
+
     def row(metric, values, fmt, lower_better=True):
         best = best_idx(values, lower_better)
-        cols = ""
-        for i, v in enumerate(values):
+        float_spec = f">{col_w}{fmt}"
+        cells = []
+        for v in values:
             if isinstance(v, float):
-                cell = f"{v:>{col_w}{fmt}}"
+                cells.append(format(v, float_spec))
             else:
-                cell = f"{str(v):>{col_w}}"
-            if i == best and best != -1:
-                cell = cell.rstrip() + "★"
-            cols += cell
-        print(f"  {metric:<38}{cols}")
+                cells.append(format(str(v), str_spec))
+        if best != -1:
+            cells[best] = cells[best].rstrip() + "★"
+        print(f"  {metric:<38}{''.join(cells)}")
 
     row("WAF (lower=better)",        wafs,                                              ".4f", lower_better=True)
     row("Wear Variance (lower=best)",[r["wear_variance"]    for r in results],          ".2f", lower_better=True)
@@ -12,6 +12,7 @@ import os
 FILES  = ["/tmp/sim_baseline.xml", "/tmp/sim_modern.xml", "/tmp/sim_rra.xml"]
 LABELS = ["Baseline\n(GREEDY)", "Modern\n(Lifespan-FIFO)", "RRA-FTL v2\n(Composite+Hot)"]
 COLORS = ["#4C9BE8", "#F4A261", "#2EC4B6"]
+FLAT_LABELS = [l.replace('\n', ' ') for l in LABELS]   # single-line form for legend/console
 OUT    = "/tmp/rra_comparison.png"
 
 def parse(path):
@@ -43,9 +44,10 @@ n_metrics = len(metrics)
 fig, axes = plt.subplots(1, n_metrics, figsize=(18, 6))
 fig.patch.set_facecolor("#0F172A")
 
+x = np.arange(len(LABELS))   # same bar positions on every panel
 for ax, (title, values) in zip(axes, metrics.items()):
-    x = np.arange(len(LABELS))
     bars = ax.bar(x, values, color=COLORS, width=0.55, edgecolor='white', linewidth=0.5)
+    top = max(values)
 
     # Mark best value
     if "Latency" in title or "Time" in title:
@@ -61,7 +63,7 @@ for ax, (title, values) in zip(axes, metrics.items()):
             label += f"\n★"
             bar.set_edgecolor("#FFD700")
             bar.set_linewidth(2.5)
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(values)*0.02,
+        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + top*0.02,
                 label, ha='center', va='bottom', color='white', fontsize=8.5, fontweight='bold')
 
     ax.set_title(title, color='white', fontsize=11, fontweight='bold', pad=10)
@@ -71,10 +73,10 @@ for ax, (title, values) in zip(axes, metrics.items()):
     ax.tick_params(colors='white')
     ax.spines[:].set_color('#334155')
     ax.yaxis.set_tick_params(labelcolor='white', labelsize=8)
-    ax.set_ylim(0, max(values) * 1.25 if max(values) > 0 else 1)
+    ax.set_ylim(0, top * 1.25 if top > 0 else 1)
 
 # Legend patches
-patches = [mpatches.Patch(color=c, label=l.replace('\n', ' ')) for c, l in zip(COLORS, LABELS)]
+patches = [mpatches.Patch(color=c, label=l) for c, l in zip(COLORS, FLAT_LABELS)]
 fig.legend(handles=patches, loc='lower center', ncol=3,
            facecolor='#1E293B', labelcolor='white', fontsize=10,
            framealpha=0.8, bbox_to_anchor=(0.5, -0.08))
@@ -88,5 +90,5 @@ print(f"Graph saved to: {OUT}")
 print("\nRaw values:")
 for title, values in metrics.items():
     print(f"  {title}:")
-    for l, v in zip(LABELS, values):
-        print(f"    {l.replace(chr(10),' '):30s}: {v:,.2f}")
+    for l, v in zip(FLAT_LABELS, values):
+        print(f"    {l:30s}: {v:,.2f}")
@@ -11,7 +11,9 @@ IO_Flow_Trace_Based::IO_Flow_Trace_Based(const sim_object_id_type &name, uint16_
 										 HostInterface_Types SSD_device_type, PCIe_Root_Complex *pcie_root_complex, SATA_HBA *sata_hba,
 										 bool enabled_logging, sim_time_type logging_period, std::string logging_file_path) : IO_Flow_Base(name, flow_id, start_lsa_on_device, end_lsa_on_device, io_queue_id, nvme_submission_queue_size, nvme_completion_queue_size, priority_class, 0, initial_occupancy_ratio, 0, SSD_device_type, pcie_root_complex, sata_hba, enabled_logging, logging_period, logging_file_path),
 																															  trace_file_path(trace_file_path), time_unit(time_unit), total_replay_no(total_replay_count), percentage_to_be_simulated(percentage_to_be_simulated),
-																															  total_requests_in_file(0), time_offset(0)
+																															  total_requests_in_file(0),
+																															  current_request_available(false), current_request_arrival_time(0), current_request_start_lba(0), current_request_lba_count(0), current_request_is_write(false),
+																															  time_offset(0)
 {
 	if (percentage_to_be_simulated > 100)
 	{
@@ -26,13 +28,13 @@ IO_Flow_Trace_Based::~IO_Flow_Trace_Based()
 
 Host_IO_Request *IO_Flow_Trace_Based::Generate_next_request()
 {
-	if (current_trace_line.size() == 0 || STAT_generated_request_count >= total_requests_to_be_generated)
+	if (!current_request_available || STAT_generated_request_count >= total_requests_to_be_generated)
 	{
 		return NULL;
 	}
 
 	Host_IO_Request *request = new Host_IO_Request;
-	if (current_trace_line[ASCIITraceTypeColumn].compare(ASCIITraceWriteCode) == 0)
+	if (current_request_is_write)
 	{
 		request->Type = Host_IO_Request_Type::WRITE;
 		STAT_generated_write_request_count++;
@@ -43,10 +45,9 @@ Host_IO_Request *IO_Flow_Trace_Based::Generate_next_request()
 		STAT_generated_read_request_count++;
 	}
 
-	char *pEnd;
-	request->LBA_count = std::strtoul(current_trace_line[ASCIITraceSizeColumn].c_str(), &pEnd, 0);
+	request->LBA_count = current_request_lba_count;
 
-	request->Start_LBA = std::strtoull(current_trace_line[ASCIITraceAddressColumn].c_str(), &pEnd, 0);
+	request->Start_LBA = current_request_start_lba;
 	if (request->Start_LBA <= (end_lsa_on_device - start_lsa_on_device))
 	{
 		request->Start_LBA += start_lsa_on_device;
@@ -90,15 +91,15 @@ void IO_Flow_Trace_Based::Start_simulation()
 	while (std::getline(trace_file, trace_line))
 	{
 		Utils::Helper_Functions::Remove_cr(trace_line);
-		current_trace_line.clear();
-		Utils::Helper_Functions::Tokenize(trace_line, ASCIILineDelimiter, current_trace_line);
-		if (current_trace_line.size() != ASCIIItemsPerLine)
+		trace_line_tokens.clear();
+		Utils::Helper_Functions::Tokenize(trace_line, ASCIILineDelimiter, trace_line_tokens);
+		if (trace_line_tokens.size() != ASCIIItemsPerLine)
 		{
 			break;
 		}
 		total_requests_in_file++;
 		sim_time_type prev_time = last_request_arrival_time;
-		last_request_arrival_time = std::strtoll(current_trace_line[ASCIITraceTimeColumn].c_str(), &pEnd, 10);
+		last_request_arrival_time = std::strtoll(trace_line_tokens[ASCIITraceTimeColumn].c_str(), &pEnd, 10);
 		if (last_request_arrival_time < prev_time)
 		{
 			PRINT_ERROR("Unexpected request arrival time: " << last_request_arrival_time << "\nMQSim expects request arrival times to be monotonically increasing in the input trace!")
@@ -118,11 +119,26 @@ void IO_Flow_Trace_Based::Start_simulation()
 	}
 
 	trace_file.open(trace_file_path);
-	current_trace_line.clear();
 	std::getline(trace_file, trace_line);
+	Load_trace_line(trace_line);
+	Simulator->Register_sim_event(current_request_arrival_time, this);
+}
+
+void IO_Flow_Trace_Based::Load_trace_line(std::string &trace_line)
+{
+	char *pEnd;
 	Utils::Helper_Functions::Remove_cr(trace_line);
-	Utils::Helper_Functions::Tokenize(trace_line, ASCIILineDelimiter, current_trace_line);
-	Simulator->Register_sim_event(std::strtoll(current_trace_line[ASCIITraceTimeColumn].c_str(), &pEnd, 10), this);
+	trace_line_tokens.clear();
+	Utils::Helper_Functions::Tokenize(trace_line, ASCIILineDelimiter, trace_line_tokens);
+	current_request_available = trace_line_tokens.size() > ASCIITraceTypeColumn;
+	if (!current_request_available)
+	{
+		return;
+	}
+	current_request_arrival_time = std::strtoll(trace_line_tokens[ASCIITraceTimeColumn].c_str(), &pEnd, 10);
+	current_request_start_lba = std::strtoull(trace_line_tokens[ASCIITraceAddressColumn].c_str(), &pEnd, 0);
+	current_request_lba_count = std::strtoul(trace_line_tokens[ASCIITraceSizeColumn].c_str(), &pEnd, 0);
+	current_request_is_write = trace_line_tokens[ASCIITraceTypeColumn].compare(ASCIITraceWriteCode) == 0;
 }
 
 void IO_Flow_Trace_Based::Validate_simulation_config()
@@ -139,27 +155,32 @@ void IO_Flow_Trace_Based::Execute_simulator_event(MQSimEngine::Sim_Event *)
 
 	if (STAT_generated_request_count < total_requests_to_be_generated)
 	{
-		std::string trace_line;
-		if (std::getline(trace_file, trace_line))
+		if (std::getline(trace_file, trace_line_buffer))
 		{
-			Utils::Helper_Functions::Remove_cr(trace_line);
-			current_trace_line.clear();
-			Utils::Helper_Functions::Tokenize(trace_line, ASCIILineDelimiter, current_trace_line);
+			Load_trace_line(trace_line_buffer);
 		}
 		else
+		{
+			current_request_available = false;
+		}
+
+		//A line that is too short to hold a request ends the trace, as in Start_simulation, so it is handled like the end of the file
+		if (!current_request_available)
 		{
 			trace_file.close();
 			trace_file.open(trace_file_path);
 			replay_counter++;
 			time_offset = Simulator->Time();
-			std::getline(trace_file, trace_line);
-			Utils::Helper_Functions::Remove_cr(trace_line);
-			current_trace_line.clear();
-			Utils::Helper_Functions::Tokenize(trace_line, ASCIILineDelimiter, current_trace_line);
+			std::getline(trace_file, trace_line_buffer);
+			Load_trace_line(trace_line_buffer);
 			PRINT_MESSAGE("* Replay round " << replay_counter << "of " << total_replay_no << " started  for" << ID())
 		}
-		char *pEnd;
-		Simulator->Register_sim_event(time_offset + std::strtoll(current_trace_line[ASCIITraceTimeColumn].c_str(), &pEnd, 10), this);
+
+		//Never schedule from a stale arrival time
+		if (current_request_available)
+		{
+			Simulator->Register_sim_event(time_offset + current_request_arrival_time, this);
+		}
 	}
 }
 
@@ -170,16 +191,11 @@ void IO_Flow_Trace_Based::Get_statistics(Utils::Workload_Statistics &stats, LPA_
 	stats.Stream_id = io_queue_id - 1; //In MQSim, there is a simple relation between stream id and the io_queue_id of NVMe
 	stats.Min_LHA = start_lsa_on_device;
 	stats.Max_LHA = end_lsa_on_device;
-	for (int i = 0; i < MAX_ARRIVAL_TIME_HISTOGRAM + 1; i++)
-	{
-		stats.Write_arrival_time.push_back(0);
-		stats.Read_arrival_time.push_back(0);
-	}
-	for (int i = 0; i < MAX_REQSIZE_HISTOGRAM_ITEMS + 1; i++)
-	{
-		stats.Write_size_histogram.push_back(0);
-		stats.Read_size_histogram.push_back(0);
-	}
+	//The histogram sizes are fixed, so each one is allocated and zeroed once instead of growing by push_back
+	stats.Write_arrival_time.assign(MAX_ARRIVAL_TIME_HISTOGRAM + 1, 0);
+	stats.Read_arrival_time.assign(MAX_ARRIVAL_TIME_HISTOGRAM + 1, 0);
+	stats.Write_size_histogram.assign(MAX_REQSIZE_HISTOGRAM_ITEMS + 1, 0);
+	stats.Read_size_histogram.assign(MAX_REQSIZE_HISTOGRAM_ITEMS + 1, 0);
 	stats.Total_generated_requests = 0;
 	stats.Total_accessed_lbas = 0;
 
@@ -205,6 +221,8 @@ void IO_Flow_Trace_Based::Get_statistics(Utils::Workload_Statistics &stats, LPA_
 		{
 			break;
 		}
+		//The request type drives both the address and the size statistics, so it is decoded once per line
+		bool is_write_request = line_splitted[ASCIITraceTypeColumn].compare(ASCIITraceWriteCode) == 0;
 		sim_time_type prev_time = last_request_arrival_time;
 		last_request_arrival_time = std::strtoull(line_splitted[ASCIITraceTimeColumn].c_str(), &pEnd, 10);
 		if (last_request_arrival_time < prev_time)
@@ -232,60 +250,45 @@ void IO_Flow_Trace_Based::Get_statistics(Utils::Workload_Statistics &stats, LPA_
 		}
 
 		//Address access pattern statistics
+		std::map<LPA_type, Utils::Address_Histogram_Unit>& access_pattern = is_write_request ? stats.Write_address_access_pattern : stats.Read_address_access_pattern;
+		std::map<LPA_type, Utils::Address_Histogram_Unit>& other_access_pattern = is_write_request ? stats.Read_address_access_pattern : stats.Write_address_access_pattern;
+		LPA_type device_address = Convert_host_logical_address_to_device_address(start_LBA);
 		while (start_LBA <= end_LBA)
 		{
-			LPA_type device_address = Convert_host_logical_address_to_device_address(start_LBA);
-			page_status_type access_status_bitmap = Find_NVM_subunit_access_bitmap(start_LBA);
-			if (line_splitted[ASCIITraceTypeColumn].compare(ASCIITraceWriteCode) == 0)
+			//Consecutive sectors of a request usually fall into the same device page, so the run is
+			//collapsed into one (page, sector count, sub-unit bitmap) update of the access pattern maps
+			LPA_type run_device_address = device_address;
+			page_status_type access_status_bitmap = 0;
+			unsigned int run_length = 0;
+			do
 			{
-				if (stats.Write_address_access_pattern.find(device_address) == stats.Write_address_access_pattern.end())
+				access_status_bitmap |= Find_NVM_subunit_access_bitmap(start_LBA);
+				run_length++;
+				start_LBA++;
+				if (start_LBA > end_lsa_on_device)
 				{
-					Utils::Address_Histogram_Unit hist;
-					hist.Access_count = 1;
-					hist.Accessed_sub_units = access_status_bitmap;
-					stats.Write_address_access_pattern[device_address] = hist;
+					start_LBA = start_lsa_on_device;
 				}
-				else
+				if (start_LBA > end_LBA)
 				{
-					stats.Write_address_access_pattern[device_address].Access_count = stats.Write_address_access_pattern[device_address].Access_count + 1;
-					stats.Write_address_access_pattern[device_address].Accessed_sub_units = stats.Write_address_access_pattern[device_address].Accessed_sub_units | access_status_bitmap;
+					break;
 				}
+				device_address = Convert_host_logical_address_to_device_address(start_LBA);
+			} while (device_address == run_device_address);
+			stats.Total_accessed_lbas += run_length;
 
-				if (stats.Read_address_access_pattern.find(device_address) != stats.Read_address_access_pattern.end())
-				{
-					stats.Write_read_shared_addresses.insert(device_address);
-				}
-			}
-			else
-			{
-				if (stats.Read_address_access_pattern.find(device_address) == stats.Read_address_access_pattern.end())
-				{
-					Utils::Address_Histogram_Unit hist;
-					hist.Access_count = 1;
-					hist.Accessed_sub_units = access_status_bitmap;
-					stats.Read_address_access_pattern[device_address] = hist;
-				}
-				else
-				{
-					stats.Read_address_access_pattern[device_address].Access_count = stats.Read_address_access_pattern[device_address].Access_count + 1;
-					stats.Read_address_access_pattern[device_address].Accessed_sub_units = stats.Read_address_access_pattern[device_address].Accessed_sub_units | access_status_bitmap;
-				}
-
-				if (stats.Write_address_access_pattern.find(device_address) != stats.Write_address_access_pattern.end())
-				{
-					stats.Write_read_shared_addresses.insert(device_address);
-				}
-			}
-			stats.Total_accessed_lbas++;
-			start_LBA++;
-			if (start_LBA > end_lsa_on_device)
+			//operator[] value-initializes a first-time page, so one lookup both creates and updates its entry
+			Utils::Address_Histogram_Unit& hist = access_pattern[run_device_address];
+			hist.Access_count += run_length;
+			hist.Accessed_sub_units |= access_status_bitmap;
+			if (other_access_pattern.find(run_device_address) != other_access_pattern.end())
 			{
-				start_LBA = start_lsa_on_device;
+				stats.Write_read_shared_addresses.insert(run_device_address);
 			}
 		}
 
 		//Request size statistics
-		if (line_splitted[ASCIITraceTypeColumn].compare(ASCIITraceWriteCode) == 0)
+		if (is_write_request)
 		{
 			if (diff < MAX_ARRIVAL_TIME_HISTOGRAM)
 			{
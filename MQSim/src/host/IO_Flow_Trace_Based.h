@@ -34,7 +34,15 @@ private:
 	std::ifstream trace_file;
 	unsigned int total_replay_no, replay_counter;
 	unsigned int total_requests_in_file;
-	std::vector<std::string> current_trace_line;
+	std::vector<std::string> trace_line_tokens; //Scratch buffer for tokenizing a trace line
+	std::string trace_line_buffer; //Reused across simulator events so replaying a line does not allocate a new string
+	//The next request of the trace, decoded once into integers when its line is read
+	bool current_request_available;
+	sim_time_type current_request_arrival_time;
+	LHA_type current_request_start_lba;
+	unsigned int current_request_lba_count;
+	bool current_request_is_write;
+	void Load_trace_line(std::string &trace_line);
 	sim_time_type time_offset;
 };
 } // namespace Host_Components
@@ -316,6 +316,8 @@ namespace SSD_Components
 					}
 				}
 			} else {
+				//The read and write histogram loops below use insert(): it keeps an LPA that is already selected and reads the
+				//bitmap from the iterator, so the histogram is not searched again for the entry being visited
 				//Step 1-1: Read LPAs are preferred for steady-state since each read should be written before the actual access
 				for (auto itr = stat->Write_read_shared_addresses.begin(); itr != stat->Write_read_shared_addresses.end(); itr++) {
 					LPA_type lpa = (*itr);
@@ -329,9 +331,7 @@ namespace SSD_Components
 				for (auto itr = stat->Read_address_access_pattern.begin(); itr != stat->Read_address_access_pattern.end(); itr++) {
 					LPA_type lpa = (*itr).first;
 					if (lpa_set_for_preconditioning.size() < no_of_logical_pages_in_steadystate) {
-						if (lpa_set_for_preconditioning.find(lpa) == lpa_set_for_preconditioning.end()) {
-							lpa_set_for_preconditioning[lpa] = stat->Read_address_access_pattern[lpa].Accessed_sub_units;
-						}
+						lpa_set_for_preconditioning.insert(std::make_pair(lpa, (*itr).second.Accessed_sub_units));
 					}
 					else {
 						break;
@@ -342,9 +342,7 @@ namespace SSD_Components
 				for (auto itr = stat->Write_address_access_pattern.begin(); itr != stat->Write_address_access_pattern.end(); itr++) {
 					LPA_type lpa = (*itr).first;
 					if (lpa_set_for_preconditioning.size() < no_of_logical_pages_in_steadystate) {
-						if (lpa_set_for_preconditioning.find(lpa) == lpa_set_for_preconditioning.end()) {
-							lpa_set_for_preconditioning[lpa] = stat->Write_address_access_pattern[lpa].Accessed_sub_units;
-						}
+						lpa_set_for_preconditioning.insert(std::make_pair(lpa, (*itr).second.Accessed_sub_units));
 					}
 					std::pair<int, LPA_type> entry((*itr).second.Access_count, lpa);
 					trace_lpas_sorted_histogram.insert(entry);
@@ -140,6 +140,39 @@ namespace SSD_Components
 
 		Stats::Block_erase_histogram[block_address.ChannelID][block_address.ChipID][block_address.DieID][block_address.PlaneID][block->Erase_count]--;
 		block->Erase();
+		plane_record->Total_erase_count++;
+		plane_record->Total_erase_count_squares += 2 * (uint64_t)block->Erase_count - 1;//(e + 1)^2 - e^2 with e the pre-erase count
+		if (block->Erase_count > plane_record->Max_erase_count) {
+			plane_record->Max_erase_count = block->Erase_count;
+			plane_record->Max_erase_count_block = block->BlockID;
+		} else if (block->Erase_count == plane_record->Max_erase_count && block->BlockID < plane_record->Max_erase_count_block) {
+			plane_record->Max_erase_count_block = block->BlockID;
+		}
+		//The minimum is only read through Get_min_max_erase_difference, i.e., by static wear-leveling, so it is not maintained otherwise
+		if (gc_and_wl_unit->Use_static_wearleveling() && block->Erase_count - 1 == plane_record->Min_erase_count) {
+			if (--plane_record->Min_erase_count_blocks == 0) {
+				//The last block at the old minimum was erased, so the new minimum is found by a full rescan of the plane.
+				//Only the blocks that were at the old minimum are known to have been erased: a single least worn block that
+				//is erased repeatedly stays the unique minimum and triggers this O(block_no_per_plane) rescan on every erase
+				plane_record->Min_erase_count = block->Erase_count;
+				for (unsigned int i = 0; i < block_no_per_plane; i++) {
+					if (plane_record->Blocks[i].Erase_count < plane_record->Min_erase_count) {
+						plane_record->Min_erase_count = plane_record->Blocks[i].Erase_count;
+						plane_record->Min_erase_count_blocks = 0;
+					}
+					if (plane_record->Blocks[i].Erase_count == plane_record->Min_erase_count && plane_record->Min_erase_count_blocks++ == 0) {
+						plane_record->Min_erase_count_block = i;
+					}
+				}
+			} else if (block->BlockID == plane_record->Min_erase_count_block) {
+				//Blocks never rejoin the minimum, so the next lowest ID at the minimum is found by moving forward
+				flash_block_ID_type i = block->BlockID + 1;
+				while (plane_record->Blocks[i].Erase_count != plane_record->Min_erase_count) {
+					i++;
+				}
+				plane_record->Min_erase_count_block = i;
+			}
+		}
 		Stats::Block_erase_histogram[block_address.ChannelID][block_address.ChipID][block_address.DieID][block_address.PlaneID][block->Erase_count]++;
 		plane_record->Add_to_free_block_pool(block, gc_and_wl_unit->Use_dynamic_wearleveling());
 		plane_record->Check_bookkeeping_correctness(block_address);
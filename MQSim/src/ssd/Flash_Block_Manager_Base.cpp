@@ -1,3 +1,4 @@
+#include <algorithm>
 #include "Flash_Block_Manager.h"
 
 
@@ -25,8 +26,18 @@ namespace SSD_Components
 						plane_manager[channelID][chipID][dieID][planeID].Free_pages_count = block_no_per_plane * pages_no_per_block;
 						plane_manager[channelID][chipID][dieID][planeID].Valid_pages_count = 0;
 						plane_manager[channelID][chipID][dieID][planeID].Invalid_pages_count = 0;
+						plane_manager[channelID][chipID][dieID][planeID].Total_erase_count = 0;
+						plane_manager[channelID][chipID][dieID][planeID].Max_erase_count = 0;
+						plane_manager[channelID][chipID][dieID][planeID].Min_erase_count = 0;
+						plane_manager[channelID][chipID][dieID][planeID].Min_erase_count_blocks = block_no_per_plane;
+						plane_manager[channelID][chipID][dieID][planeID].Max_erase_count_block = 0;
+						plane_manager[channelID][chipID][dieID][planeID].Min_erase_count_block = 0;
+						plane_manager[channelID][chipID][dieID][planeID].Total_erase_count_squares = 0;
 						plane_manager[channelID][chipID][dieID][planeID].Ongoing_erase_operations.clear();
 						plane_manager[channelID][chipID][dieID][planeID].Blocks = new Block_Pool_Slot_Type[block_no_per_plane];
+						Block_Pool_Slot_Type::Page_vector_size = pages_no_per_block / (sizeof(uint64_t) * 8) + (pages_no_per_block % (sizeof(uint64_t) * 8) == 0 ? 0 : 1);
+						plane_manager[channelID][chipID][dieID][planeID].Invalid_page_bitmaps = new uint64_t[block_no_per_plane * Block_Pool_Slot_Type::Page_vector_size];
+						std::fill_n(plane_manager[channelID][chipID][dieID][planeID].Invalid_page_bitmaps, block_no_per_plane * Block_Pool_Slot_Type::Page_vector_size, All_VALID_PAGE);
 						
 						//Initialize block pool for plane
 						for (unsigned int blockID = 0; blockID < block_no_per_plane; blockID++) {
@@ -40,11 +51,7 @@ namespace SSD_Components
 							plane_manager[channelID][chipID][dieID][planeID].Blocks[blockID].Erase_transaction = NULL;
 							plane_manager[channelID][chipID][dieID][planeID].Blocks[blockID].Ongoing_user_program_count = 0;
 							plane_manager[channelID][chipID][dieID][planeID].Blocks[blockID].Ongoing_user_read_count = 0;
-							Block_Pool_Slot_Type::Page_vector_size = pages_no_per_block / (sizeof(uint64_t) * 8) + (pages_no_per_block % (sizeof(uint64_t) * 8) == 0 ? 0 : 1);
-							plane_manager[channelID][chipID][dieID][planeID].Blocks[blockID].Invalid_page_bitmap = new uint64_t[Block_Pool_Slot_Type::Page_vector_size];
-							for (unsigned int i = 0; i < Block_Pool_Slot_Type::Page_vector_size; i++) {
-								plane_manager[channelID][chipID][dieID][planeID].Blocks[blockID].Invalid_page_bitmap[i] = All_VALID_PAGE;
-							}
+							plane_manager[channelID][chipID][dieID][planeID].Blocks[blockID].Invalid_page_bitmap = &plane_manager[channelID][chipID][dieID][planeID].Invalid_page_bitmaps[blockID * Block_Pool_Slot_Type::Page_vector_size];
 							plane_manager[channelID][chipID][dieID][planeID].Add_to_free_block_pool(&plane_manager[channelID][chipID][dieID][planeID].Blocks[blockID], false);
 						}
 						plane_manager[channelID][chipID][dieID][planeID].Data_wf = new Block_Pool_Slot_Type*[total_concurrent_streams_no];
@@ -67,9 +74,7 @@ namespace SSD_Components
 			for (unsigned int chip_id = 0; chip_id < chip_no_per_channel; chip_id++) {
 				for (unsigned int die_id = 0; die_id < die_no_per_chip; die_id++) {
 					for (unsigned int plane_id = 0; plane_id < plane_no_per_die; plane_id++) {
-						for (unsigned int blockID = 0; blockID < block_no_per_plane; blockID++) {
-							delete[] plane_manager[channel_id][chip_id][die_id][plane_id].Blocks[blockID].Invalid_page_bitmap;
-						}
+						delete[] plane_manager[channel_id][chip_id][die_id][plane_id].Invalid_page_bitmaps;
 						delete[] plane_manager[channel_id][chip_id][die_id][plane_id].Blocks;
 						delete[] plane_manager[channel_id][chip_id][die_id][plane_id].GC_wf;
 						delete[] plane_manager[channel_id][chip_id][die_id][plane_id].Data_wf;
@@ -94,9 +99,7 @@ namespace SSD_Components
 		Current_page_write_index = 0;
 		Invalid_page_count = 0;
 		Erase_count++;
-		for (unsigned int i = 0; i < Block_Pool_Slot_Type::Page_vector_size; i++) {
-			Invalid_page_bitmap[i] = All_VALID_PAGE;
-		}
+		std::fill_n(Invalid_page_bitmap, Block_Pool_Slot_Type::Page_vector_size, All_VALID_PAGE);
 		Stream_id = NO_STREAM;
 		Holds_mapping_data = false;
 		Erase_transaction = NULL;
@@ -145,20 +148,11 @@ namespace SSD_Components
 
 	unsigned int Flash_Block_Manager_Base::Get_min_max_erase_difference(const NVM::FlashMemory::Physical_Page_Address& plane_address)
 	{
-		unsigned int min_erased_block = 0;
-		unsigned int max_erased_block = 0;
 		PlaneBookKeepingType *plane_record = &plane_manager[plane_address.ChannelID][plane_address.ChipID][plane_address.DieID][plane_address.PlaneID];
 
-		for (unsigned int i = 1; i < block_no_per_plane; i++) {
-			if (plane_record->Blocks[i].Erase_count > plane_record->Blocks[max_erased_block].Erase_count) {
-				max_erased_block = i;
-			}
-			if (plane_record->Blocks[i].Erase_count < plane_record->Blocks[min_erased_block].Erase_count) {
-				min_erased_block = i;
-			}
-		}
-
-		return max_erased_block - min_erased_block;
+		//The difference is taken between the IDs of the most and least erased blocks (the lowest ID of each on ties),
+		//as the original full-plane scan did; static wear-leveling decisions depend on this value
+		return plane_record->Max_erase_count_block - plane_record->Min_erase_count_block;
 	}
 
 	flash_block_ID_type Flash_Block_Manager_Base::Get_coldest_block_id(const NVM::FlashMemory::Physical_Page_Address& plane_address)
@@ -29,20 +29,22 @@ namespace SSD_Components
 	class Block_Pool_Slot_Type
 	{
 	public:
+		//Fields are laid out so the slot has no interior padding (56 bytes instead of 64); the counters and
+		//flags read by the GC victim scans all sit in the first 32 bytes, ahead of the pointers.
 		flash_block_ID_type BlockID;
 		flash_page_ID_type Current_page_write_index;
-		Block_Service_Status Current_status;
 		unsigned int Invalid_page_count;
 		unsigned int Erase_count;
-		static unsigned int Page_vector_size;
-		uint64_t* Invalid_page_bitmap;//A bit sequence that keeps track of valid/invalid status of pages in the block. A "0" means valid, and a "1" means invalid.
+		Block_Service_Status Current_status;
+		int Ongoing_user_read_count;
+		int Ongoing_user_program_count;
 		stream_id_type Stream_id = NO_STREAM;
-		bool Holds_mapping_data = false;
 		bool Has_ongoing_gc_wl = false;
-		NVM_Transaction_Flash_ER* Erase_transaction;
 		bool Hot_block = false;//Used for hot/cold separation mentioned in the "On the necessity of hot and cold data identification to reduce the write amplification in flash-based SSDs", Perf. Eval., 2014.
-		int Ongoing_user_read_count;
-		int Ongoing_user_program_count;
+		uint64_t* Invalid_page_bitmap;//A bit sequence that keeps track of valid/invalid status of pages in the block. A "0" means valid, and a "1" means invalid.
+		NVM_Transaction_Flash_ER* Erase_transaction;
+		bool Holds_mapping_data = false;
+		static unsigned int Page_vector_size;
 		void Erase();
 	};
 
@@ -53,7 +55,15 @@ namespace SSD_Components
 		unsigned int Free_pages_count;
 		unsigned int Valid_pages_count;
 		unsigned int Invalid_pages_count;
+		unsigned int Max_erase_count;//Largest Erase_count in the plane; erase counts only grow, so a running max is exact
+		unsigned int Min_erase_count;//Smallest Erase_count in the plane; only maintained when static wear-leveling is enabled
+		unsigned int Min_erase_count_blocks;//Number of blocks whose Erase_count equals Min_erase_count; the blocks are rescanned only when this drops to zero
+		flash_block_ID_type Max_erase_count_block;//Lowest ID among the blocks whose Erase_count equals Max_erase_count
+		flash_block_ID_type Min_erase_count_block;//Lowest ID among the blocks whose Erase_count equals Min_erase_count; only maintained when static wear-leveling is enabled
+		uint64_t Total_erase_count;//Sum of Erase_count over all blocks of the plane, maintained incrementally on erase
+		uint64_t Total_erase_count_squares;//Sum of Erase_count^2 over all blocks of the plane; with Total_erase_count it gives the wear variance in O(1)
 		Block_Pool_Slot_Type* Blocks;
+		uint64_t* Invalid_page_bitmaps;//One contiguous allocation holding the Invalid_page_bitmap of every block in the plane, Page_vector_size words per block
 		std::multimap<unsigned int, Block_Pool_Slot_Type*> Free_block_pool;
 		Block_Pool_Slot_Type** Data_wf, ** GC_wf; //The write frontier blocks for data and GC pages. MQSim adopts Double Write Frontier approach for user and GC writes which is shown very advantages in: B. Van Houdt, "On the necessity of hot and cold data identification to reduce the write amplification in flash - based SSDs", Perf. Eval., 2014
 		Block_Pool_Slot_Type** Translation_wf; //The write frontier blocks for translation GC pages
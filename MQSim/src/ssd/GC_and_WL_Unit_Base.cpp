@@ -208,7 +208,7 @@ namespace SSD_Components
 		return dynamic_wearleveling_enabled;
 	}
 
-	inline bool GC_and_WL_Unit_Base::Use_static_wearleveling()
+	bool GC_and_WL_Unit_Base::Use_static_wearleveling()
 	{
 		return static_wearleveling_enabled;
 	}
@@ -260,7 +260,7 @@ namespace SSD_Components
 		Block_Pool_Slot_Type* block = &pbke->Blocks[wl_candidate_block_id];
 
 		//Run the state machine to protect against race condition
-		block_manager->GC_WL_started(wl_candidate_block_id);
+		block_manager->GC_WL_started(wl_candidate_address);
 		pbke->Ongoing_erase_operations.insert(wl_candidate_block_id);
 		address_mapping_unit->Set_barrier_for_accessing_physical_block(wl_candidate_address);//Lock the block, so no user request can intervene while the GC is progressing
 		if (block_manager->Can_execute_gc_wl(wl_candidate_address)) {//If there are ongoing requests targeting the candidate block, the gc execution should be postponed
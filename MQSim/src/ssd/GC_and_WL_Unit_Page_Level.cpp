@@ -43,7 +43,7 @@ namespace SSD_Components
 	void GC_and_WL_Unit_Page_Level::Check_gc_required(const unsigned int free_block_pool_size, const NVM::FlashMemory::Physical_Page_Address& plane_address)
 	{
 		if (free_block_pool_size < block_pool_gc_threshold) {
-			flash_block_ID_type gc_candidate_block_id = block_manager->Get_coldest_block_id(plane_address);
+			flash_block_ID_type gc_candidate_block_id = 0;//Every selection policy below assigns the candidate, so no coldest-block scan is needed here
 			PlaneBookKeepingType* pbke = block_manager->Get_plane_bookkeeping_entry(plane_address);
 
 			if (pbke->Ongoing_erase_operations.size() >= max_ongoing_gc_reqs_per_plane) {
@@ -22,9 +22,24 @@
 #include <cmath>
 #include <algorithm>
 #include <stdexcept>
+#ifdef _MSC_VER
+#include <intrin.h>
+#endif
 
 namespace SSD_Components {
 
+// Index of the lowest set bit; x must be non-zero
+static inline unsigned int Rra_count_trailing_zeros(uint64_t x)
+{
+#ifdef _MSC_VER
+    unsigned long idx;
+    _BitScanForward64(&idx, x);
+    return static_cast<unsigned int>(idx);
+#else
+    return static_cast<unsigned int>(__builtin_ctzll(x));
+#endif
+}
+
 // ─────────────────────────────────────────────────────────────────────────────
 // Constructor
 // ─────────────────────────────────────────────────────────────────────────────
@@ -70,15 +85,22 @@ GC_and_WL_Unit_Page_Level_RRA::GC_and_WL_Unit_Page_Level_RRA(
     // Adaptive threshold [NEW]
     , m_base_gc_threshold(gc_threshold)
     , m_adaptive_gc_threshold(gc_threshold)
+    , m_adaptive_threshold_blocks(0)
     , m_recent_write_count(0)
     , m_threshold_update_interval(1000)   // recalculate every 1000 writes
+    , m_block_write_counts(block_count, 0)
+    , m_pareto_head(0)
+    , m_pareto_count(0)
+    , m_quarantine_erase_count(0)
 {
     Build_weibull_lut();
+    Refresh_adaptive_threshold_blocks();
 }
 
 // ─────────────────────────────────────────────────────────────────────────────
 // Build_weibull_lut: pre-computes 157 Q10 entries so the hot scoring path
-// never does floating-point exponentiation.
+// never does floating-point exponentiation. The quarantine cutoff is fixed
+// by the same table, so it is resolved here to a single erase count.
 // ─────────────────────────────────────────────────────────────────────────────
 void GC_and_WL_Unit_Page_Level_RRA::Build_weibull_lut()
 {
@@ -91,6 +113,16 @@ void GC_and_WL_Unit_Page_Level_RRA::Build_weibull_lut()
         if (q10 > 1024) q10 = 1024;
         m_weibull_lut[i] = static_cast<uint16_t>(q10);
     }
+
+    int first_quarantined = RRA_LUT_SIZE;   // past the LUT the score is 0
+    for (int i = 0; i < RRA_LUT_SIZE; ++i) {
+        if (m_weibull_lut[i] / 1024.0 < RRA_QUARANTINE_THRESHOLD) {
+            first_quarantined = i;
+            break;
+        }
+    }
+    m_quarantine_erase_count =
+        static_cast<unsigned int>(first_quarantined * RRA_LUT_BUCKET);
 }
 
 // ─────────────────────────────────────────────────────────────────────────────
@@ -115,23 +147,21 @@ double GC_and_WL_Unit_Page_Level_RRA::Adaptive_erase_ns(unsigned int erase_count
 
 // ─────────────────────────────────────────────────────────────────────────────
 // Compute_wear_variance — population variance of per-block erase counts
+// O(1): the plane bookkeeping keeps the integer sum and sum of squares of
+// erase counts up to date on every erase, so
+//   Var = (n * sum_sq - sum^2) / n^2
+// The numerator is formed exactly in uint64_t and is never negative; it is
+// rounded only when converted to double for the single division.
 // ─────────────────────────────────────────────────────────────────────────────
 double GC_and_WL_Unit_Page_Level_RRA::Compute_wear_variance(
     PlaneBookKeepingType* pbk) const
 {
     if (!pbk || block_no_per_plane == 0) return 0.0;
 
-    double sum = 0.0;
-    for (unsigned int b = 0; b < block_no_per_plane; ++b)
-        sum += pbk->Blocks[b].Erase_count;
-    double mean = sum / block_no_per_plane;
-
-    double var = 0.0;
-    for (unsigned int b = 0; b < block_no_per_plane; ++b) {
-        double d = pbk->Blocks[b].Erase_count - mean;
-        var += d * d;
-    }
-    return var / block_no_per_plane;
+    const uint64_t n         = block_no_per_plane;
+    const uint64_t numerator = n * pbk->Total_erase_count_squares
+                             - pbk->Total_erase_count * pbk->Total_erase_count;
+    return static_cast<double>(numerator) / static_cast<double>(n * n);
 }
 
 // ─────────────────────────────────────────────────────────────────────────────
@@ -140,8 +170,8 @@ double GC_and_WL_Unit_Page_Level_RRA::Compute_wear_variance(
 // ─────────────────────────────────────────────────────────────────────────────
 void GC_and_WL_Unit_Page_Level_RRA::Record_page_write(flash_block_ID_type block_id)
 {
-    unsigned int& cnt = m_block_write_counts[block_id];
-    ++cnt;
+    if (block_id < m_block_write_counts.size())
+        ++m_block_write_counts[block_id];
     ++m_recent_write_count;
 }
 
@@ -164,11 +194,8 @@ void GC_and_WL_Unit_Page_Level_RRA::Update_adaptive_threshold(
     double write_pressure    = static_cast<double>(m_recent_write_count) / neutral_writes;
     m_recent_write_count     = 0;
 
-    // Average wear ratio
-    double sum_ec = 0.0;
-    for (unsigned int b = 0; b < block_no_per_plane; ++b)
-        sum_ec += pbk->Blocks[b].Erase_count;
-    double avg_wear_ratio = (sum_ec / block_no_per_plane) / m_pe_endurance;
+    // Average wear ratio (plane-wide erase total is kept by the block manager)
+    double avg_wear_ratio = (static_cast<double>(pbk->Total_erase_count) / block_no_per_plane) / m_pe_endurance;
 
     m_adaptive_gc_threshold = m_base_gc_threshold
         * (1.0 + RRA_ADAPTIVE_PRESSURE_K * write_pressure)
@@ -180,6 +207,22 @@ void GC_and_WL_Unit_Page_Level_RRA::Update_adaptive_threshold(
         m_adaptive_gc_threshold = max_threshold;
     if (m_adaptive_gc_threshold < m_base_gc_threshold)
         m_adaptive_gc_threshold = m_base_gc_threshold;
+
+    Refresh_adaptive_threshold_blocks();
+}
+
+// ─────────────────────────────────────────────────────────────────────────────
+// Refresh_adaptive_threshold_blocks — converts the adaptive threshold into an
+// absolute free-block count once per update, so Check_gc_required's common
+// "enough free blocks" exit is a single integer compare.
+// block_pool_gc_threshold is the base count from the parent class.
+// ─────────────────────────────────────────────────────────────────────────────
+void GC_and_WL_Unit_Page_Level_RRA::Refresh_adaptive_threshold_blocks()
+{
+    m_adaptive_threshold_blocks = static_cast<unsigned int>(
+        m_adaptive_gc_threshold * static_cast<double>(block_no_per_plane));
+    if (m_adaptive_threshold_blocks < block_pool_gc_threshold)
+        m_adaptive_threshold_blocks = block_pool_gc_threshold;
 }
 
 // ─────────────────────────────────────────────────────────────────────────────
@@ -198,7 +241,7 @@ flash_block_ID_type GC_and_WL_Unit_Page_Level_RRA::Get_wl_write_frontier(
         Block_Pool_Slot_Type& blk = pbk->Blocks[b];
         // A free block: no valid pages, no ongoing erases, Current_page_write_index == 0
         if (blk.Current_page_write_index == 0 && blk.Invalid_page_count == 0) {
-            if (pbk->Ongoing_erase_operations.find(b) != pbk->Ongoing_erase_operations.end())
+            if (blk.Has_ongoing_gc_wl)
                 continue;
             if (blk.Erase_count < min_ec) {
                 min_ec   = blk.Erase_count;
@@ -220,8 +263,14 @@ flash_block_ID_type GC_and_WL_Unit_Page_Level_RRA::Get_wl_write_frontier(
 //              + γ * RemainingBudget(b)  [Weibull health score]
 //              + δ * HotBonus(b)         [+1 if hot block, else 0]       [NEW δ term]
 //
+//   Since MigrationCost = 1 - Efficiency, the first two terms fold into
+//   (α+β) * invalid_pages / total_pages - β; the constant -β does not change
+//   the argmax, so the scan only evaluates the folded linear form.
+//
 //   Quarantine: blocks with RemainingBudget < 0.05 are skipped.
 //   Fallback:   if quarantine excludes everything → plain GREEDY.
+//               The greedy candidate is tracked in the same pass, so a
+//               fully quarantined plane does not cost a second scan.
 // ─────────────────────────────────────────────────────────────────────────────
 Block_Pool_Slot_Type*
 GC_and_WL_Unit_Page_Level_RRA::Get_next_gc_victim(
@@ -231,40 +280,52 @@ GC_and_WL_Unit_Page_Level_RRA::Get_next_gc_victim(
     ++m_gc_epoch_counter;
 
     Block_Pool_Slot_Type* victim     = nullptr;
+    Block_Pool_Slot_Type* greedy     = nullptr;   // quarantine fallback
     double                best_score = -std::numeric_limits<double>::infinity();
 
-    const double total_pages_d = static_cast<double>(pages_no_per_block);
-
-    // Update hot_block flags from write counts
-    for (auto& kv : m_block_write_counts) {
-        if (kv.first < block_no_per_plane)
-            pbk->Blocks[kv.first].Hot_block = (kv.second >= RRA_HOT_WRITE_THRESHOLD);
+    // Folded α/β coefficient per invalid page; one divide per GC, not per block
+    const double eff_weight = (m_alpha + m_beta) / static_cast<double>(pages_no_per_block);
+
+    // Scan-loop invariants held in locals: the loop stores through block
+    // pointers, so member reads via `this` could otherwise be reloaded
+    Block_Pool_Slot_Type* const blocks        = pbk->Blocks;
+    const unsigned int          block_count   = block_no_per_plane;
+    const unsigned int          full_index    = pages_no_per_block;
+    const double                gamma         = m_gamma;
+    const double                delta         = m_delta;
+    const unsigned int          quarantine_ec = m_quarantine_erase_count;
+    const unsigned int* const   write_counts  = m_block_write_counts.data();
+
+    // Update hot_block flags from write counts (blocks not written this
+    // epoch keep their previous classification)
+    for (unsigned int b = 0; b < block_count; ++b) {
+        if (write_counts[b])
+            blocks[b].Hot_block = (write_counts[b] >= RRA_HOT_WRITE_THRESHOLD);
     }
 
-    for (unsigned int b = 0; b < block_no_per_plane; ++b) {
-        Block_Pool_Slot_Type& blk = pbk->Blocks[b];
+    for (unsigned int b = 0; b < block_count; ++b) {
+        Block_Pool_Slot_Type& blk = blocks[b];
 
-        // Must have something to reclaim and must be fully written
+        // Must have something to reclaim; skip blocks currently being erased
+        // (per-block flag mirrors Ongoing_erase_operations without a set lookup)
         if (blk.Invalid_page_count == 0) continue;
-        if (blk.Current_page_write_index < pages_no_per_block) continue;
+        if (blk.Has_ongoing_gc_wl) continue;
 
-        // Skip blocks currently being erased
-        if (pbk->Ongoing_erase_operations.find(b) != pbk->Ongoing_erase_operations.end())
-            continue;
+        if (!greedy || blk.Invalid_page_count > greedy->Invalid_page_count)
+            greedy = &blk;
 
-        // [8] Quarantine — protect near-end-of-life blocks
-        double rem_budget = Weibull_score(blk.Erase_count);
-        if (rem_budget < RRA_QUARANTINE_THRESHOLD) continue;
+        // Scored candidates must be fully written
+        if (blk.Current_page_write_index < full_index) continue;
 
-        // Composite score:
-        double efficiency      = static_cast<double>(blk.Invalid_page_count)  / total_pages_d;
-        double migration_cost  = static_cast<double>(pages_no_per_block - blk.Invalid_page_count) / total_pages_d;  // [NEW β]
-        double hot_bonus       = blk.Hot_block ? 1.0 : 0.0;  // [NEW δ]
+        // [8] Quarantine — protect near-end-of-life blocks; an integer
+        // compare against the cutoff precomputed from the Weibull LUT
+        if (blk.Erase_count >= quarantine_ec) continue;
+        double rem_budget = Weibull_score(blk.Erase_count);
 
-        double score = m_alpha * efficiency
-                     - m_beta  * migration_cost   // [NEW: was absent in v1]
-                     + m_gamma * rem_budget
-                     + m_delta * hot_bonus;        // [NEW]
+        // Composite score (α efficiency and β migration cost folded):
+        double score = eff_weight * static_cast<double>(blk.Invalid_page_count)
+                     + gamma * rem_budget
+                     + (blk.Hot_block ? delta : 0.0);   // [NEW δ]
 
         if (score > best_score) {
             best_score = score;
@@ -273,16 +334,8 @@ GC_and_WL_Unit_Page_Level_RRA::Get_next_gc_victim(
     }
 
     // Quarantine fallback: GREEDY without quarantine restriction
-    if (!victim) {
-        for (unsigned int b = 0; b < block_no_per_plane; ++b) {
-            Block_Pool_Slot_Type& blk = pbk->Blocks[b];
-            if (blk.Invalid_page_count == 0) continue;
-            if (pbk->Ongoing_erase_operations.find(b) != pbk->Ongoing_erase_operations.end())
-                continue;
-            if (!victim || blk.Invalid_page_count > victim->Invalid_page_count)
-                victim = &blk;
-        }
-    }
+    if (!victim)
+        victim = greedy;
 
     // Pareto-epoch adaptive tuning
     if (m_gc_epoch_counter % RRA_TUNE_EVERY_N_GC == 0)
@@ -290,7 +343,7 @@ GC_and_WL_Unit_Page_Level_RRA::Get_next_gc_victim(
 
     // Reset hot/cold counters every GC epoch to track recent activity only
     if (m_gc_epoch_counter % (RRA_TUNE_EVERY_N_GC * 4) == 0)
-        m_block_write_counts.clear();
+        std::fill(m_block_write_counts.begin(), m_block_write_counts.end(), 0u);
 
     return victim;
 }
@@ -315,12 +368,8 @@ void GC_and_WL_Unit_Page_Level_RRA::Pareto_adapt(PlaneBookKeepingType* pbk)
 {
     double raw_waf = 1.0;
     if (m_gc_epoch_counter > 1) {
-        double total_erases = 0, max_ec = 0;
-        for (unsigned int b = 0; b < block_no_per_plane; ++b) {
-            total_erases += pbk->Blocks[b].Erase_count;
-            if (pbk->Blocks[b].Erase_count > max_ec)
-                max_ec = pbk->Blocks[b].Erase_count;
-        }
+        double total_erases = pbk->Total_erase_count;
+        double max_ec       = pbk->Max_erase_count;
         if (total_erases > 0 && block_no_per_plane > 0)
             raw_waf = max_ec / (total_erases / static_cast<double>(block_no_per_plane));
     }
@@ -330,12 +379,17 @@ void GC_and_WL_Unit_Page_Level_RRA::Pareto_adapt(PlaneBookKeepingType* pbk)
     m_ema_waf      = RRA_EMA_LAMBDA * raw_waf + (1.0 - RRA_EMA_LAMBDA) * m_ema_waf;
     m_ema_variance = RRA_EMA_LAMBDA * raw_var + (1.0 - RRA_EMA_LAMBDA) * m_ema_variance;
 
-    m_pareto_window.push_back({m_ema_waf, m_ema_variance, m_alpha, m_beta, m_gamma});
-    if (static_cast<int>(m_pareto_window.size()) > RRA_PARETO_WINDOW_SIZE)
-        m_pareto_window.pop_front();
+    const int newest = m_pareto_head;
+    m_pareto_window[newest] = {m_ema_waf, m_ema_variance, m_alpha, m_beta, m_gamma};
+    m_pareto_head = (m_pareto_head + 1) % RRA_PARETO_WINDOW_SIZE;
+    if (m_pareto_count < RRA_PARETO_WINDOW_SIZE)
+        ++m_pareto_count;
 
+    // Dominance only needs set membership, so the ring is scanned in slot
+    // order and just the point written above is skipped
     bool dominated = false;
-    for (int i = 0; i < static_cast<int>(m_pareto_window.size()) - 1; ++i) {
+    for (int i = 0; i < m_pareto_count; ++i) {
+        if (i == newest) continue;
         const auto& p = m_pareto_window[i];
         if (p.waf <= m_ema_waf && p.variance <= m_ema_variance) {
             dominated = true;
@@ -353,18 +407,19 @@ void GC_and_WL_Unit_Page_Level_RRA::Pareto_adapt(PlaneBookKeepingType* pbk)
         m_beta  = 1.5;
         m_gamma = 0.5;
     } else {
-        double waf_dev = m_ema_waf      - RRA_TARGET_WAF;
-        double var_dev = m_ema_variance - RRA_TARGET_VAR;
-
-        if (waf_dev > RRA_DEAD_BAND_WAF) {
-            m_alpha += DELTA;
-            m_beta  += DELTA;       // also increase migration cost penalty
-            m_gamma -= DELTA_SMALL;
-        }
-        if (var_dev > RRA_DEAD_BAND_VAR) {
-            m_gamma += DELTA;       // favor healthier blocks
-            m_alpha -= DELTA_SMALL;
-        }
+        // Branchless update: each out-of-band condition is a 0/1 multiplier
+        // WAF high      → +α, +β (migration cost penalty), small -γ
+        // variance high → +γ (favor healthier blocks), small -α
+        const double waf_hi = static_cast<double>(m_ema_waf      - RRA_TARGET_WAF > RRA_DEAD_BAND_WAF);
+        const double var_hi = static_cast<double>(m_ema_variance - RRA_TARGET_VAR > RRA_DEAD_BAND_VAR);
+
+        // The WAF deltas are applied before the variance deltas, one at a time,
+        // so α and γ round exactly as the original two conditional blocks did
+        m_alpha += DELTA * waf_hi;
+        m_beta  += DELTA * waf_hi;
+        m_gamma -= DELTA_SMALL * waf_hi;
+        m_gamma += DELTA * var_hi;
+        m_alpha -= DELTA_SMALL * var_hi;
     }
 
     auto clamp = [](double v){ return std::max(0.1, std::min(2.0, v)); };
@@ -381,22 +436,16 @@ void GC_and_WL_Unit_Page_Level_RRA::Check_gc_required(
     const unsigned int free_block_pool_size,
     const NVM::FlashMemory::Physical_Page_Address& plane_address)
 {
-    PlaneBookKeepingType* pbke = block_manager->Get_plane_bookkeeping_entry(plane_address);
-
     // [NEW] Adaptively update threshold periodically
     if (m_recent_write_count >= m_threshold_update_interval)
-        Update_adaptive_threshold(pbke);
+        Update_adaptive_threshold(block_manager->Get_plane_bookkeeping_entry(plane_address));
 
-    // Compute adaptive threshold as an absolute free-block count
-    // block_pool_gc_threshold is the base count from the parent class
-    unsigned int adaptive_threshold_blocks = static_cast<unsigned int>(
-        m_adaptive_gc_threshold * static_cast<double>(block_no_per_plane));
-    if (adaptive_threshold_blocks < block_pool_gc_threshold)
-        adaptive_threshold_blocks = block_pool_gc_threshold;
-
-    if (free_block_pool_size >= adaptive_threshold_blocks)
+    // Fast path: cached absolute free-block threshold
+    if (free_block_pool_size >= m_adaptive_threshold_blocks)
         return;  // enough free space — no GC needed
 
+    PlaneBookKeepingType* pbke = block_manager->Get_plane_bookkeeping_entry(plane_address);
+
     if (pbke->Ongoing_erase_operations.size() >= max_ongoing_gc_reqs_per_plane)
         return;
 
@@ -405,8 +454,7 @@ void GC_and_WL_Unit_Page_Level_RRA::Check_gc_required(
 
     flash_block_ID_type gc_candidate_block_id = victim->BlockID;
 
-    if (pbke->Ongoing_erase_operations.find(gc_candidate_block_id) !=
-        pbke->Ongoing_erase_operations.end())
+    if (victim->Has_ongoing_gc_wl)
         return;
 
     NVM::FlashMemory::Physical_Page_Address gc_candidate_address(plane_address);
@@ -434,27 +482,41 @@ void GC_and_WL_Unit_Page_Level_RRA::Check_gc_required(
         if (block->Current_page_write_index - block->Invalid_page_count > 0) {
             NVM_Transaction_Flash_RD* gc_read  = NULL;
             NVM_Transaction_Flash_WR* gc_write = NULL;
-            for (flash_page_ID_type pageID = 0; pageID < block->Current_page_write_index; pageID++) {
-                if (block_manager->Is_page_valid(block, pageID)) {
+            // Loop invariants of the page-copy loop
+            const flash_page_ID_type written_pages = block->Current_page_write_index;
+            const stream_id_type     stream_id     = block->Stream_id;
+            const unsigned int       page_bytes    = sector_no_per_page * SECTOR_SIZE_IN_BYTE;
+            // Walk the valid pages word by word: invert the invalid bitmap,
+            // mask off unwritten pages, then peel set bits with ctz so the
+            // loop runs once per valid page instead of once per written page
+            const unsigned int words = (written_pages + 63) / 64;
+            for (unsigned int w = 0; w < words; w++) {
+                uint64_t valid = ~block->Invalid_page_bitmap[w];
+                const flash_page_ID_type first_page = w * 64;
+                if (written_pages - first_page < 64)
+                    valid &= (((uint64_t)1) << (written_pages - first_page)) - 1;
+                while (valid) {
+                    const flash_page_ID_type pageID = first_page + Rra_count_trailing_zeros(valid);
+                    valid &= valid - 1;
                     Stats::Total_page_movements_for_gc++;
                     gc_candidate_address.PageID = pageID;
                     if (use_copyback) {
                         gc_write = new NVM_Transaction_Flash_WR(
-                            Transaction_Source_Type::GC_WL, block->Stream_id,
-                            sector_no_per_page * SECTOR_SIZE_IN_BYTE,
+                            Transaction_Source_Type::GC_WL, stream_id,
+                            page_bytes,
                             NO_LPA, address_mapping_unit->Convert_address_to_ppa(gc_candidate_address),
                             NULL, 0, NULL, 0, INVALID_TIME_STAMP);
                         gc_write->ExecutionMode = WriteExecutionModeType::COPYBACK;
                         tsu->Submit_transaction(gc_write);
                     } else {
                         gc_read = new NVM_Transaction_Flash_RD(
-                            Transaction_Source_Type::GC_WL, block->Stream_id,
-                            sector_no_per_page * SECTOR_SIZE_IN_BYTE,
+                            Transaction_Source_Type::GC_WL, stream_id,
+                            page_bytes,
                             NO_LPA, address_mapping_unit->Convert_address_to_ppa(gc_candidate_address),
                             gc_candidate_address, NULL, 0, NULL, 0, INVALID_TIME_STAMP);
                         gc_write = new NVM_Transaction_Flash_WR(
-                            Transaction_Source_Type::GC_WL, block->Stream_id,
-                            sector_no_per_page * SECTOR_SIZE_IN_BYTE,
+                            Transaction_Source_Type::GC_WL, stream_id,
+                            page_bytes,
                             NO_LPA, NO_PPA, gc_candidate_address,
                             NULL, 0, gc_read, 0, INVALID_TIME_STAMP);
                         gc_write->ExecutionMode  = WriteExecutionModeType::SIMPLE;
@@ -43,10 +43,8 @@
 
 #include "GC_and_WL_Unit_Page_Level.h"
 #include <cmath>
-#include <deque>
 #include <vector>
 #include <limits>
-#include <unordered_map>
 
 namespace SSD_Components {
 
@@ -176,17 +174,25 @@ private:
     // ── Adaptive GC threshold state [NEW] ─────────────────────────────────
     double       m_base_gc_threshold;          // from ssdconfig GC_Exec_Threshold
     double       m_adaptive_gc_threshold;      // current effective threshold
+    unsigned int m_adaptive_threshold_blocks;  // same threshold as a free-block count
     unsigned int m_recent_write_count;         // writes since last threshold update
     unsigned int m_threshold_update_interval;  // update every N writes
 
     // ── Hot/cold tracking [NEW] ──────────────────────────────────────────
-    // block_id → write access count (per-plane, reset per GC epoch)
-    std::unordered_map<flash_block_ID_type, unsigned int> m_block_write_counts;
+    // block_id → write access count (per-plane, reset per GC epoch); dense,
+    // indexed by block id, so the write path is a plain array increment
+    std::vector<unsigned int> m_block_write_counts;
 
-    std::deque<RRA_ParetoPoint> m_pareto_window;
+    // Fixed-size ring of recent Pareto points; no per-epoch allocation
+    RRA_ParetoPoint m_pareto_window[RRA_PARETO_WINDOW_SIZE];
+    int             m_pareto_head;    // next slot to overwrite
+    int             m_pareto_count;   // valid entries (<= window size)
 
     // Weibull LUT (Q10 fixed-point)
     uint16_t m_weibull_lut[RRA_LUT_SIZE];
+    // First erase count whose Weibull score falls below the quarantine
+    // threshold; derived from the LUT, which is non-increasing
+    unsigned int m_quarantine_erase_count;
 
     // ── Internal helpers ──────────────────────────────────────────────────
     void   Build_weibull_lut();
@@ -197,6 +203,7 @@ private:
 
     // [NEW] Adaptive threshold update
     void   Update_adaptive_threshold(PlaneBookKeepingType* pbk);
+    void   Refresh_adaptive_threshold_blocks();
 
     // [NEW] Wear-leveling: pick lowest-erase free block as write frontier
     flash_block_ID_type Get_wl_write_frontier(PlaneBookKeepingType* pbk) const;
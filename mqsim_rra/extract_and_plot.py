@@ -201,6 +201,7 @@ plt.rcParams.update({"font.family": "DejaVu Sans", "font.size": 11,
                      "axes.grid": True, "grid.alpha": 0.35, "figure.dpi": 150})
 
 WORKLOADS = list(results.keys())
+XPOS      = np.arange(len(WORKLOADS))
 base_latency  = [results[w]["baseline"].get("latency_us", 0) for w in WORKLOADS]
 mod_latency   = [results[w]["modern"].get("latency_us", 0)   for w in WORKLOADS]
 rra_latency   = [results[w]["rra"]["latency_us"]              for w in WORKLOADS]
@@ -216,7 +217,7 @@ base_util     = [results[w]["baseline"].get("avg_chip_util", 0) * 100 for w in W
 mod_util      = [results[w]["modern"].get("avg_chip_util", 0) * 100 for w in WORKLOADS]
 
 def grouped_bar_3(ax, va, vb, vc, title, ylabel, higher_better=False):
-    x = np.arange(len(WORKLOADS))
+    x = XPOS
     w = 0.25
     ax.bar(x - w, va, w, label="Baseline (GREEDY)", color=C_BASE, edgecolor="white")
     ax.bar(x,     vb, w, label="Modern (Lifespan GC)", color=C_MOD,  edgecolor="white")
@@ -279,23 +280,21 @@ base_flash_writes = [results[w]["baseline"].get("flash_writes", 0) for w in WORK
 base_flash_erases = [results[w]["baseline"].get("flash_erases", 0) for w in WORKLOADS]
 
 fig, ax = plt.subplots(figsize=(11, 6))
-xb    = np.arange(len(WORKLOADS))
+xb    = XPOS
 bw    = 0.25
 C_READ  = "#5BA4DB"
 C_WRITE = "#E05C5C"
 C_ERASE = "#F0A500"
 
-r1 = ax.bar(xb - bw, [max(v, 1) for v in base_flash_reads],  bw, label="Flash Reads",  color=C_READ,  edgecolor="white")
-r2 = ax.bar(xb,      [max(v, 1) for v in base_flash_writes], bw, label="Flash Writes", color=C_WRITE, edgecolor="white")
-r3 = ax.bar(xb + bw, [max(v, 1) for v in base_flash_erases], bw, label="Flash Erases", color=C_ERASE, edgecolor="white")
-
-# Hide placeholder bars (value was 0, padded to 1 for log scale)
-for bar, real_val in zip(r1, base_flash_reads):
-    if real_val == 0: bar.set_alpha(0)
-for bar, real_val in zip(r2, base_flash_writes):
-    if real_val == 0: bar.set_alpha(0)
-for bar, real_val in zip(r3, base_flash_erases):
-    if real_val == 0: bar.set_alpha(0)
+for offset, counts, label, color in ((-bw, base_flash_reads,  "Flash Reads",  C_READ),
+                                     (0.0, base_flash_writes, "Flash Writes", C_WRITE),
+                                     (bw,  base_flash_erases, "Flash Erases", C_ERASE)):
+    counts = np.asarray(counts)
+    bars   = ax.bar(xb + offset, np.maximum(counts, 1), bw, label=label, color=color, edgecolor="white")
+    # Hide placeholder bars (value was 0, padded to 1 for log scale)
+    for bar, c in zip(bars, counts):
+        if c == 0:
+            bar.set_alpha(0)
 
 # Log scale: makes all workloads legible regardless of magnitude
 ax.set_yscale("log")
@@ -333,7 +332,6 @@ for i, w in enumerate(WORKLOADS):
         rra_iops.append(base_iops[i])
 
 fig, ax = plt.subplots(figsize=(10, 5.5))
-xb = np.arange(len(WORKLOADS))
 width = 0.25
 ax.bar(xb - width, base_iops, width, label="Baseline (GREEDY)", color=C_BASE, edgecolor="white")
 ax.bar(xb,         mod_iops,  width, label="Modern (Lifespan GC)", color=C_MOD,  edgecolor="white")
@@ -44,6 +44,7 @@ GRAPH_DIR  = os.path.join(SCRIPT_DIR, "results", "graphs")
 os.makedirs(GRAPH_DIR, exist_ok=True)
 
 WORKLOADS   = ["Sequential", "Random", "Hotspot (80/20)"]
+XPOS        = np.arange(len(WORKLOADS))
 BASE_FILES  = ["data_seq_baseline.xml",  "data_rand_baseline.xml",  "data_hotspot_baseline.xml"]
 RRA_FILES   = ["data_seq_rra.xml",       "data_rand_rra.xml",       "data_hotspot_rra.xml"]
 
@@ -85,14 +86,13 @@ def parse_xml(path: str) -> dict:
             except: r[ch.tag] = ch.text
 
     # Erase counts → wear metrics
-    ec = [int(b.find("Erase_Count").text)
-          for b in root.iter("Block")
-          if b.find("Erase_Count") is not None and b.find("Erase_Count").text]
-    if ec:
-        mean = sum(ec) / len(ec)
-        r["wear_variance"]    = sum((x - mean)**2 for x in ec) / len(ec)
-        r["max_erase_count"]  = max(ec)
-        r["min_erase_count"]  = min(ec)
+    ec = np.fromiter((int(t) for t in (b.findtext("Erase_Count")
+                                       for b in root.iter("Block")) if t),
+                     dtype=np.int64)
+    if ec.size:
+        r["wear_variance"]    = float(ec.var())
+        r["max_erase_count"]  = int(ec.max())
+        r["min_erase_count"]  = int(ec.min())
     else:
         r["wear_variance"]   = 0.0
         r["max_erase_count"] = 0
@@ -107,8 +107,9 @@ def get_latency_us(r: dict) -> float:
     ns = r.get("Average_Response_Time_NS", 0.0)
     return (ns or 0.0) / 1000.0
 
-def lifetime_years(r: dict, max_pe=10000) -> float:
-    waf = get_waf(r)
+def lifetime_years(r: dict, max_pe=10000, waf=None) -> float:
+    if waf is None:
+        waf = get_waf(r)
     mx  = r.get("max_erase_count", 0)
     if waf <= 0 or mx <= 0:
         return 0.0
@@ -149,19 +150,15 @@ def collect_metrics():
         if not rb or not rr:
             use_estimates = True
             break
-        base_m["waf"].append(get_waf(rb))
-        base_m["wear_variance"].append(rb.get("wear_variance", 0))
-        base_m["max_erase"].append(rb.get("max_erase_count", 0))
-        base_m["min_erase"].append(rb.get("min_erase_count", 0))
-        base_m["latency_us"].append(get_latency_us(rb))
-        base_m["lifetime_yr"].append(lifetime_years(rb))
-
-        rra_m["waf"].append(get_waf(rr))
-        rra_m["wear_variance"].append(rr.get("wear_variance", 0))
-        rra_m["max_erase"].append(rr.get("max_erase_count", 0))
-        rra_m["min_erase"].append(rr.get("min_erase_count", 0))
-        rra_m["latency_us"].append(get_latency_us(rr))
-        rra_m["lifetime_yr"].append(lifetime_years(rr))
+        # One pass per result: WAF is derived once and shared with the lifetime estimate
+        for r, m in ((rb, base_m), (rr, rra_m)):
+            waf = get_waf(r)
+            m["waf"].append(waf)
+            m["wear_variance"].append(r.get("wear_variance", 0))
+            m["max_erase"].append(r.get("max_erase_count", 0))
+            m["min_erase"].append(r.get("min_erase_count", 0))
+            m["latency_us"].append(get_latency_us(r))
+            m["lifetime_yr"].append(lifetime_years(r, waf=waf))
 
     if use_estimates:
         print("[plot_comparison] INFO: RRA output XMLs not found — using paper estimates.")
@@ -174,7 +171,7 @@ def collect_metrics():
 
 # ── Chart helpers ─────────────────────────────────────────────────────────────
 def grouped_bar(ax, values_a, values_b, title, ylabel, higher_better=False):
-    x     = np.arange(len(WORKLOADS))
+    x     = XPOS
     width = 0.35
     bars_a = ax.bar(x - width/2, values_a, width, label="Baseline (GREEDY)", color=C_BASE, edgecolor="white", linewidth=0.5)
     bars_b = ax.bar(x + width/2, values_b, width, label="RRA-FTL",           color=C_RRA,  edgecolor="white", linewidth=0.5)
@@ -33,60 +33,96 @@ fi
 mkdir -p "$RESULTS"
 cd "$CONFIGS" || exit 1
 
-# ── Progress timer ─────────────────────────────────────────────────────────
-run_with_progress() {
+# ── Launch / wait helpers ─────────────────────────────────────────────────
+# The three workloads are independent single-threaded simulations, so they
+# run as concurrent processes. Each writes its own out_*.txt and its own
+# <workload>_scenario_1.xml, so nothing is shared between them.
+# Memory: all three 1M-request simulations on the 2048 blk x 256 pg config
+# are resident at once, so peak RAM is about three times that of a single
+# run. There is no cap on concurrency; on a small machine run the workloads
+# one at a time instead.
+PIDS=()
+LABELS=()
+WORKLOADS=()
+DESTS=()
+
+launch() {
     local label="$1"
     local workload="$2"
     local out_txt="$3"
     local data_dest="$4"
-    local start
-    start=$(date +%s)
 
     echo "  Starting: $label"
     "$MQSIM" -i "ssdconfig_original.xml" -w "$workload" > "$out_txt" 2>&1 &
-    local pid=$!
+    PIDS+=("$!")
+    LABELS+=("$label")
+    WORKLOADS+=("$workload")
+    DESTS+=("$data_dest")
+}
 
-    while kill -0 "$pid" 2>/dev/null; do
+wait_all_with_progress() {
+    local start
+    start=$(date +%s)
+
+    # Each job's elapsed time is recorded the first time it is seen finished
+    local finished=()
+    local i
+    while :; do
+        local running=0
         local elapsed=$(( $(date +%s) - start ))
-        printf "\r  [%s] Running... %02d:%02d  " "$label" $(( elapsed/60 )) $(( elapsed%60 ))
+        for i in "${!PIDS[@]}"; do
+            if kill -0 "${PIDS[$i]}" 2>/dev/null; then
+                running=$(( running + 1 ))
+            elif [ -z "${finished[$i]}" ]; then
+                finished[$i]=$elapsed
+            fi
+        done
+        [ $running -eq 0 ] && break
+        printf "\r  [%d/%d running] %02d:%02d  " "$running" "${#PIDS[@]}" $(( elapsed/60 )) $(( elapsed%60 ))
         sleep 3
     done
 
-    wait "$pid"; local ec=$?
     local elapsed=$(( $(date +%s) - start ))
-    if [ $ec -eq 0 ]; then
-        printf "\r  [%s] DONE in %02d:%02d                     \n" "$label" $(( elapsed/60 )) $(( elapsed%60 ))
-    else
-        printf "\r  [%s] FAILED (exit %d)\n" "$label" "$ec"
-    fi
-
-    # MQSim drops the scenario XML in the CWD (MQSim_Baseline/)
-    local base
-    base=$(basename "$workload" .xml)
-    if [ -f "${base}_scenario_1.xml" ]; then
-        mv "${base}_scenario_1.xml" "$data_dest"
-    fi
+    printf "\r  All workloads finished in %02d:%02d              \n" $(( elapsed/60 )) $(( elapsed%60 ))
+
+    for i in "${!PIDS[@]}"; do
+        wait "${PIDS[$i]}"; local ec=$?
+        if [ $ec -eq 0 ]; then
+            printf "  [%s] DONE in %02d:%02d\n" "${LABELS[$i]}" $(( finished[i]/60 )) $(( finished[i]%60 ))
+        else
+            printf "  [%s] FAILED (exit %d)\n" "${LABELS[$i]}" "$ec"
+        fi
+
+        # MQSim drops the scenario XML in the CWD (MQSim_Baseline/)
+        local base
+        base=$(basename "${WORKLOADS[$i]}" .xml)
+        if [ -f "${base}_scenario_1.xml" ]; then
+            mv "${base}_scenario_1.xml" "${DESTS[$i]}"
+        fi
+    done
 }
 
-# ── Run all 3 workloads ───────────────────────────────────────────────────
-run_with_progress \
+# ── Run all 3 workloads in parallel ───────────────────────────────────────
+launch \
     "Sequential  (25% pre-fill)" \
     "workload_seq_original.xml" \
     "$RESULTS/out_seq.txt" \
     "$RESULTS/data_seq_baseline.xml"
 
-run_with_progress \
+launch \
     "Random      (25% pre-fill)" \
     "workload_rand_original.xml" \
     "$RESULTS/out_rand.txt" \
     "$RESULTS/data_rand_baseline.xml"
 
-run_with_progress \
+launch \
     "Hotspot 80/20 (25% pre-fill)" \
     "workload_hotspot_original.xml" \
     "$RESULTS/out_hotspot.txt" \
     "$RESULTS/data_hotspot_baseline.xml"
 
+wait_all_with_progress
+
 echo ""
 echo "============================================================"
 echo "  BASELINE COMPLETE — Results saved to: $RESULTS"